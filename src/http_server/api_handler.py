@@ -1,99 +1,59 @@
 """API request handler for fake data generation."""
 
-import json
+import hashlib
 import logging
-from http.server import BaseHTTPRequestHandler
-from urllib.parse import urlparse, parse_qs
-from typing import Dict, Any
+import socket
+import socketserver
+import threading
+import time
+from http import HTTPStatus
+from urllib.parse import unquote_to_bytes
+from typing import Callable, Dict, Tuple
 
-from .fake_data import FakeDataGenerator
+from faker.config import AVAILABLE_LOCALES
 
+from .fake_data import FakeDataGenerator, dumps
 
-class APIRequestHandler(BaseHTTPRequestHandler):
-    """HTTP request handler with API endpoints for fake data generation."""
 
-    # Class-level generator instance
-    fake_generator = FakeDataGenerator()
+# (status code, content type, encoded body)
+Response = Tuple[int, bytes, bytes]
 
-    def log_message(self, format, *args):
-        """Override to use logging module instead of stderr."""
-        logging.info("%s - %s" % (self.address_string(), format % args))
+# Longest request target accepted; every valid API URL fits easily
+MAX_URI_LENGTH = 512
 
-    def do_GET(self):
-        """Handle GET requests."""
-        parsed_path = urlparse(self.path)
-        path = parsed_path.path
-
-        # API endpoints
-        if path == '/api/generate':
-            self.handle_generate()
-        elif path == '/api/types':
-            self.handle_types()
-        elif path == '/api/health':
-            self.handle_health()
-        elif path == '/' or path == '/api' or path == '/api/':
-            self.handle_root()
-        else:
-            # Return 404 for non-API routes
-            self.send_error_response(404, f"Endpoint not found: {path}")
+_JSON = b'application/json'
+_HTML = b'text/html'
 
-    def handle_generate(self):
-        """Handle /api/generate endpoint to generate fake data."""
-        try:
-            parsed_path = urlparse(self.path)
-            params = parse_qs(parsed_path.query)
-
-            # Get parameters
-            data_type = params.get('type', ['name'])[0]
-            count = int(params.get('count', ['1'])[0])
-            locale = params.get('locale', ['en_US'])[0]
-
-            # Validate count
-            if count < 1 or count > 100:
-                self.send_error_response(400, "Count must be between 1 and 100")
-                return
-
-            # Generate fake data
-            generator = FakeDataGenerator(locale=locale)
-            data = generator.generate(data_type, count)
-
-            # Send response
-            response = {
-                'success': True,
-                'type': data_type,
-                'count': count,
-                'data': data if count > 1 else data[0]
-            }
-            self.send_json_response(200, response)
-
-        except ValueError as e:
-            self.send_error_response(400, str(e))
-        except Exception as e:
-            logging.error(f"Error generating fake data: {e}")
-            self.send_error_response(500, "Internal server error")
-
-    def handle_types(self):
-        """Handle /api/types endpoint to list available data types."""
-        types = self.fake_generator.get_available_types()
-        response = {
-            'success': True,
-            'count': len(types),
-            'types': types
-        }
-        self.send_json_response(200, response)
-
-    def handle_health(self):
-        """Handle /api/health endpoint for health checks."""
-        response = {
-            'success': True,
-            'status': 'healthy',
-            'service': 'fake-data-api'
-        }
-        self.send_json_response(200, response)
+# Everything but the status, Content-Type, Content-Length, Connection and
+# optional caching headers is fixed, so responses are formatted from a
+# single template
+_RESPONSE_HEAD = (
+    b'HTTP/1.1 %d %s\r\n'
+    b'Content-Type: %s\r\n'
+    b'Content-Length: %d\r\n'
+    b'%s'
+    b'Access-Control-Allow-Origin: *\r\n'
+    b'Connection: %s\r\n'
+    b'\r\n'
+)
+_NOT_MODIFIED_HEAD = (
+    b'HTTP/1.1 304 Not Modified\r\n'
+    b'%s'
+    b'Access-Control-Allow-Origin: *\r\n'
+    b'Connection: %s\r\n'
+    b'\r\n'
+)
+_REASONS = {status.value: status.phrase.encode('ascii') for status in HTTPStatus}
+
+# Largest request head (request line and headers) accepted
+_MAX_HEAD_SIZE = 8192
+_RECV_SIZE = 4096
+
+# /api/generate response up to the start of the data value
+_GENERATE_HEAD = b'{"success":true,"type":%s,"count":%d,"data":'
 
-    def handle_root(self):
-        """Handle root endpoint with API documentation."""
-        html = """<!DOCTYPE html>
+
+_ROOT_HTML = """<!DOCTYPE html>
 <html>
 <head>
     <title>Fake Data Generator API</title>
@@ -200,27 +160,412 @@ curl "http://localhost:8000/api/types"
     </pre>
 </body>
 </html>"""
-        self.send_html_response(200, html)
-
-    def send_json_response(self, status_code: int, data: Dict[str, Any]):
-        """Send a JSON response."""
-        self.send_response(status_code)
-        self.send_header('Content-Type', 'application/json')
-        self.send_header('Access-Control-Allow-Origin', '*')
-        self.end_headers()
-        self.wfile.write(json.dumps(data, indent=2).encode('utf-8'))
-
-    def send_html_response(self, status_code: int, html: str):
-        """Send an HTML response."""
-        self.send_response(status_code)
-        self.send_header('Content-Type', 'text/html')
-        self.end_headers()
-        self.wfile.write(html.encode('utf-8'))
+
+# Responses that never change are encoded once at import time.
+_ROOT_HTML_BYTES = _ROOT_HTML.encode('utf-8')
+_HEALTH_JSON_BYTES = dumps({
+    'success': True,
+    'status': 'healthy',
+    'service': 'fake-data-api'
+})
+_TYPES = FakeDataGenerator.get_available_types()
+_TYPES_SET = frozenset(_TYPES)
+_TYPES_JSON_BYTES = dumps({
+    'success': True,
+    'count': len(_TYPES),
+    'types': _TYPES
+})
+
+
+def _etag(body: bytes) -> bytes:
+    """Compute a strong ETag for a response body."""
+    return b'"%s"' % hashlib.sha1(body).hexdigest().encode('ascii')
+
+
+# Raw request path -> (ETag, Cache-Control) for responses that never change
+# while the server runs. The health check is always revalidated so monitors
+# never see a cached answer.
+_ROOT_CACHE = (_etag(_ROOT_HTML_BYTES), b'public, max-age=3600')
+CACHE_HEADERS: Dict[bytes, Tuple[bytes, bytes]] = {
+    b'/': _ROOT_CACHE,
+    b'/api': _ROOT_CACHE,
+    b'/api/': _ROOT_CACHE,
+    b'/api/types': (_etag(_TYPES_JSON_BYTES), b'public, max-age=3600'),
+    b'/api/health': (_etag(_HEALTH_JSON_BYTES), b'no-cache'),
+}
+
+
+def etag_matches(if_none_match: bytes, etag: bytes) -> bool:
+    """
+    Check whether an If-None-Match header value matches an ETag.
+
+    Args:
+        if_none_match: Raw header value, a list of ETags or '*'
+        etag: Current ETag of the resource
+
+    Returns:
+        True if the client's copy is current
+    """
+    if if_none_match.strip() == b'*':
+        return True
+    for candidate in if_none_match.split(b','):
+        candidate = candidate.strip()
+        # If-None-Match uses weak comparison
+        if candidate.startswith(b'W/'):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
+
+
+# Building a Faker instance is expensive, so generators are shared per locale.
+_GEN_CACHE: Dict[str, FakeDataGenerator] = {}
+_GEN_LOCK = threading.Lock()
+
+
+def _get_generator(locale: str) -> FakeDataGenerator:
+    """
+    Return the shared generator for a locale, creating it on first use.
+
+    Args:
+        locale: Locale for generated data (e.g., 'en_US', 'fr_FR')
+
+    Raises:
+        ValueError: If the locale is not supported by Faker
+    """
+    # Faker accepts 'en-US' as well as 'en_US'
+    locale = locale.replace('-', '_')
+    generator = _GEN_CACHE.get(locale)
+    if generator is None:
+        # Only known locales are cached so arbitrary query strings
+        # cannot grow the cache without bound
+        if locale not in AVAILABLE_LOCALES:
+            raise ValueError(f"Unknown locale: {locale}")
+        with _GEN_LOCK:
+            generator = _GEN_CACHE.get(locale)
+            if generator is None:
+                generator = FakeDataGenerator(locale=locale)
+                _GEN_CACHE[locale] = generator
+    return generator
+
+
+def _parse_query(query: bytes) -> Dict[bytes, str]:
+    """
+    Parse a query string into a dict of decoded values.
+
+    Only a few scalar parameters are used, so this skips parse_qs and its
+    per-value lists. Like parse_qs, blank values are ignored and the first
+    occurrence of a key wins.
+
+    Args:
+        query: Raw query string without the leading '?'
+
+    Returns:
+        Dict mapping decoded parameter names to decoded values
+    """
+    params = {}
+    for pair in query.split(b'&'):
+        key, _, value = pair.partition(b'=')
+        if not value:
+            continue
+        if b'%' in key or b'+' in key:
+            key = unquote_to_bytes(key.replace(b'+', b' '))
+        if key in params:
+            continue
+        if b'%' in value or b'+' in value:
+            value = unquote_to_bytes(value.replace(b'+', b' '))
+        params[key] = value.decode('utf-8', 'replace')
+    return params
+
+
+# Endpoint implementations shared by the threaded and ASGI servers. Each
+# takes the raw query string bytes and returns a complete Response.
+
+def generate_response(query: bytes = b'') -> Response:
+    """Build the /api/generate response for a query string."""
+    try:
+        params = _parse_query(query)
+
+        # Get parameters
+        data_type = params.get(b'type', 'name')
+        count_str = params.get(b'count', '1')
+        locale = params.get(b'locale', 'en_US')
+
+        # Validate parameters up front rather than relying on exceptions
+        if not (count_str.isascii() and count_str.isdigit()):
+            return error_response(400, "Count must be between 1 and 100")
+        count = int(count_str)
+        if count < 1 or count > 100:
+            return error_response(400, "Count must be between 1 and 100")
+        if data_type not in _TYPES_SET:
+            return error_response(400, f"Unknown data type: {data_type}")
+
+        # Generate fake data
+        generator = _get_generator(locale)
+        data = generator.generate_bytes(data_type, count)
+
+        # Splice the already serialized data into the response envelope
+        body = _GENERATE_HEAD % (dumps(data_type), count) + data + b'}'
+        return 200, _JSON, body
+
+    except ValueError as e:
+        return error_response(400, str(e))
+    except Exception as e:
+        logging.error(f"Error generating fake data: {e}")
+        return error_response(500, "Internal server error")
+
+
+def types_response(query: bytes = b'') -> Response:
+    """Build the /api/types response listing available data types."""
+    return 200, _JSON, _TYPES_JSON_BYTES
+
+
+def health_response(query: bytes = b'') -> Response:
+    """Build the /api/health response."""
+    return 200, _JSON, _HEALTH_JSON_BYTES
+
+
+def root_response(query: bytes = b'') -> Response:
+    """Build the HTML documentation page response."""
+    return 200, _HTML, _ROOT_HTML_BYTES
+
+
+def error_response(status_code: int, message: str) -> Response:
+    """Build a JSON error response."""
+    response = {
+        'success': False,
+        'error': message
+    }
+    return status_code, _JSON, dumps(response)
+
+
+def _origin_form(target: bytes) -> bytes:
+    """
+    Reduce an absolute-form request target to its path and query.
+
+    Args:
+        target: Raw request target, e.g. b'http://host/api/health'
+
+    Returns:
+        The target without scheme and authority, or unchanged if it is
+        not an http(s) URL
+    """
+    scheme, sep, rest = target.partition(b'://')
+    if not sep or scheme.lower() not in (b'http', b'https'):
+        return target
+    end = len(rest)
+    for delimiter in (b'/', b'?'):
+        index = rest.find(delimiter)
+        if 0 <= index < end:
+            end = index
+    path = rest[end:]
+    return path if path.startswith(b'/') else b'/' + path
+
+
+# Raw request path -> function building its response
+ROUTES: Dict[bytes, Callable[[bytes], Response]] = {
+    b'/api/generate': generate_response,
+    b'/api/types': types_response,
+    b'/api/health': health_response,
+    b'/': root_response,
+    b'/api': root_response,
+    b'/api/': root_response,
+}
+
+
+class APIRequestHandler(socketserver.BaseRequestHandler):
+    """
+    HTTP request handler with API endpoints for fake data generation.
+
+    The API only answers GET requests without a body, so requests are parsed
+    straight out of the socket buffer instead of going through
+    BaseHTTPRequestHandler's line-by-line parser. Connections are kept alive
+    following HTTP/1.1 rules. Servers with a true parks_idle_connections
+    attribute take idle connections back between requests, and the handler
+    then sets idle instead of waiting for the next request itself.
+    """
+
+    # Seconds a worker thread waits on a connection for a complete request
+    # head, however slowly it trickles in
+    timeout = 2
+
+    def setup(self):
+        """Prepare the connection for reading requests."""
+        # Send responses immediately instead of waiting to coalesce packets
+        self.request.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, True)
+        self._buffer = b''
+        self.close_connection = False
+        self.requestline = ''
+        self.if_none_match = b''
+        self.idle = False
+
+    def handle(self):
+        """Serve requests until the connection closes or goes idle."""
+        park = getattr(self.server, 'parks_idle_connections', False)
+        try:
+            while not self.close_connection:
+                head = self._read_head()
+                if head is None:
+                    break
+                self.handle_one_request(head)
+                if park and not self._buffer and not self.close_connection:
+                    # Nothing pipelined: leave the wait for the next request
+                    # to the server rather than blocking this thread on it
+                    self.idle = True
+                    break
+        except (ConnectionError, TimeoutError):
+            # The client went away or was too slow to send a request
+            pass
+
+    def _read_head(self):
+        """
+        Read the next request head from the connection.
+
+        Returns:
+            Request line and headers without the final blank line, or None
+            if the connection was closed or the head is too large
+
+        Raises:
+            TimeoutError: If the head is not complete within timeout seconds
+        """
+        deadline = time.monotonic() + self.timeout
+        buffer = self._buffer
+        while True:
+            # Empty lines before a request line must be ignored
+            buffer = buffer.lstrip(b'\r\n')
+            end = buffer.find(b'\r\n\r\n', 0, _MAX_HEAD_SIZE)
+            # Lines may also end in a bare LF
+            bare = buffer.find(b'\n\n', 0, end if end >= 0 else _MAX_HEAD_SIZE)
+            if bare >= 0:
+                self._buffer = buffer[bare + 2:]
+                return buffer[:bare]
+            if end >= 0:
+                self._buffer = buffer[end + 4:]
+                return buffer[:end]
+            if len(buffer) >= _MAX_HEAD_SIZE:
+                self.close_connection = True
+                self.send_error_response(431, "Request header fields too large")
+                return None
+            # The deadline covers the whole head, so a client sending a
+            # byte at a time cannot hold this thread indefinitely
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutError
+            self.request.settimeout(remaining)
+            chunk = self.request.recv(_RECV_SIZE)
+            if not chunk:
+                return None
+            buffer += chunk
+
+    def handle_one_request(self, head: bytes):
+        """Parse a request head and send the response for it."""
+        # Lines are split on LF alone; a CR left before it is whitespace
+        request_line, _, header_block = head.partition(b'\n')
+        self.requestline = request_line.rstrip(b'\r').decode('iso-8859-1')
+
+        parts = request_line.split()
+        if len(parts) != 3 or not parts[2].startswith(b'HTTP/'):
+            self.close_connection = True
+            self.send_error_response(400, f"Bad request syntax ({self.requestline!r})")
+            return
+        method, target, version = parts
+
+        # HTTP/1.1 connections stay open unless the client asks otherwise,
+        # HTTP/1.0 ones only when it asks for it
+        if version == b'HTTP/1.1':
+            keep_alive = True
+        elif version == b'HTTP/1.0':
+            keep_alive = False
+        else:
+            self.close_connection = True
+            self.send_error_response(505, "HTTP version not supported")
+            return
+
+        self.if_none_match = b''
+        for line in header_block.split(b'\n'):
+            name, _, value = line.partition(b':')
+            name = name.strip().lower()
+            if name == b'if-none-match':
+                self.if_none_match = value
+            elif name == b'connection':
+                options = [option.strip() for option in value.lower().split(b',')]
+                if b'close' in options:
+                    keep_alive = False
+                elif b'keep-alive' in options:
+                    keep_alive = True
+            elif name == b'transfer-encoding' or (
+                    name == b'content-length' and value.strip() != b'0'):
+                # Request bodies are never read, so the connection cannot
+                # be reused once one has been sent
+                keep_alive = False
+        self.close_connection = not keep_alive
+
+        if method != b'GET':
+            self.close_connection = True
+            self.send_error_response(
+                501, f"Unsupported method ({method.decode('iso-8859-1')!r})"
+            )
+            return
+
+        self.do_GET(target)
+
+    def log_request(self, code='-', size='-'):
+        """Log an accepted request at debug level, shown with --verbose."""
+        if logging.root.isEnabledFor(logging.DEBUG):
+            logging.debug('%s - "%s" %s %s',
+                          self.client_address[0], self.requestline, code, size)
+
+    def do_GET(self, target: bytes):
+        """Handle GET requests."""
+        if len(target) > MAX_URI_LENGTH:
+            self.send_error_response(414, "URI too long")
+            return
+
+        if not target.startswith(b'/'):
+            target = _origin_form(target)
+        path, _, query = target.partition(b'?')
+        endpoint = ROUTES.get(path)
+        if endpoint is None:
+            # Return 404 for non-API routes
+            self.send_error_response(
+                404, f"Endpoint not found: {path.decode('iso-8859-1')}"
+            )
+            return
+
+        cache = CACHE_HEADERS.get(path)
+        if cache is None:
+            self._send_raw(*endpoint(query))
+            return
+
+        etag, cache_control = cache
+        headers = b'ETag: %s\r\nCache-Control: %s\r\n' % (etag, cache_control)
+        if self.if_none_match and etag_matches(self.if_none_match, etag):
+            self._send_not_modified(headers)
+        else:
+            self._send_raw(*endpoint(query), headers=headers)
+
+    def _send_raw(self, status_code: int, content_type: bytes, body: bytes,
+                  headers: bytes = b''):
+        """Send an already encoded response body with a single write."""
+        self.log_request(status_code)
+        head = _RESPONSE_HEAD % (
+            status_code,
+            _REASONS[status_code],
+            content_type,
+            len(body),
+            headers,
+            b'close' if self.close_connection else b'keep-alive'
+        )
+        self.request.sendall(head + body)
+
+    def _send_not_modified(self, headers: bytes):
+        """Send a bodiless 304 response."""
+        self.log_request(304)
+        self.request.sendall(_NOT_MODIFIED_HEAD % (
+            headers,
+            b'close' if self.close_connection else b'keep-alive'
+        ))
 
     def send_error_response(self, status_code: int, message: str):
         """Send an error response."""
-        response = {
-            'success': False,
-            'error': message
-        }
-        self.send_json_response(status_code, response)
+        self._send_raw(*error_response(status_code, message))
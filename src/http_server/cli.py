@@ -18,14 +18,42 @@ from .server import start_server
     help='Port number to listen on',
     show_default=True
 )
+@click.option(
+    '-w', '--workers',
+    type=click.IntRange(min=1),
+    default=None,
+    help='Number of worker processes',
+    show_default='one per CPU'
+)
+@click.option(
+    '-t', '--threads',
+    type=click.IntRange(min=1),
+    default=None,
+    help='Number of worker threads per process',
+    show_default='4 per CPU'
+)
+@click.option(
+    '--async', 'use_async',
+    is_flag=True,
+    help='Serve with uvicorn instead of the threaded server'
+)
 @click.option(
     '-v', '--verbose',
     is_flag=True,
     help='Enable verbose logging'
 )
-def main(host, port, verbose):
+def main(host, port, workers, threads, use_async, verbose):
     """Start a multithreaded fake data generation API server."""
-    start_server(host, port, verbose)
+    if use_async:
+        try:
+            from .server_async import start_async_server
+        except ImportError:
+            raise click.UsageError(
+                "--async requires the 'async' extra (uv sync --extra async)"
+            )
+        start_async_server(host, port, verbose, workers)
+    else:
+        start_server(host, port, verbose, workers, threads)
 
 
 if __name__ == '__main__':
@@ -1,10 +1,125 @@
 """Fake data generator module using Faker library."""
 
-import json
-from typing import Any, Dict, List
+from decimal import Decimal
+from operator import attrgetter
+from typing import Any, Dict, List, Tuple
 from faker import Faker
 
 
+def _default(obj: Any) -> Any:
+    """Serialize types that neither JSON backend handles natively."""
+    if isinstance(obj, Decimal):
+        return float(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+try:
+    import orjson
+
+    def dumps(data: Any) -> bytes:
+        """Serialize data to compact JSON bytes."""
+        return orjson.dumps(data, default=_default)
+except ImportError:
+    import json
+
+    def dumps(data: Any) -> bytes:
+        """Serialize data to compact JSON bytes."""
+        return json.dumps(
+            data, default=_default, separators=(',', ':')
+        ).encode('utf-8')
+
+
+# Data type -> attribute of FakeDataGenerator producing it, in the order
+# /api/types lists them. This is the single source of truth for both the
+# generator map and the list of available types.
+_FAKE_METHODS = {
+    # Personal
+    'name': 'fake.name',
+    'first_name': 'fake.first_name',
+    'last_name': 'fake.last_name',
+    'email': 'fake.email',
+    'phone': 'fake.phone_number',
+    'ssn': 'fake.ssn',
+    'username': 'fake.user_name',
+    'password': 'fake.password',
+
+    # Address
+    'address': 'fake.address',
+    'street_address': 'fake.street_address',
+    'city': 'fake.city',
+    'state': 'fake.state',
+    'zipcode': 'fake.zipcode',
+    'country': 'fake.country',
+    'latitude': 'fake.latitude',
+    'longitude': 'fake.longitude',
+
+    # Company
+    'company': 'fake.company',
+    'job': 'fake.job',
+    'company_email': 'fake.company_email',
+
+    # Internet
+    'url': 'fake.url',
+    'domain_name': 'fake.domain_name',
+    'ipv4': 'fake.ipv4',
+    'ipv6': 'fake.ipv6',
+    'mac_address': 'fake.mac_address',
+    'user_agent': 'fake.user_agent',
+
+    # Text
+    'text': 'fake.text',
+    'sentence': 'fake.sentence',
+    'paragraph': 'fake.paragraph',
+    'word': 'fake.word',
+
+    # Date/Time
+    'date': 'fake.date',
+    'time': 'fake.time',
+    'datetime': 'generate_datetime',
+    'year': 'fake.year',
+
+    # Numbers
+    'random_int': 'generate_random_int',
+    'random_digit': 'fake.random_digit',
+
+    # Credit Card
+    'credit_card_number': 'fake.credit_card_number',
+    'credit_card_provider': 'fake.credit_card_provider',
+    'credit_card_expire': 'fake.credit_card_expire',
+
+    # Currency
+    'currency_code': 'fake.currency_code',
+    'currency_name': 'fake.currency_name',
+
+    # File
+    'file_name': 'fake.file_name',
+    'file_extension': 'fake.file_extension',
+    'mime_type': 'fake.mime_type',
+
+    # Color
+    'color_name': 'fake.color_name',
+    'hex_color': 'fake.hex_color',
+    'rgb_color': 'fake.rgb_color',
+
+    # UUID
+    'uuid4': 'generate_uuid4',
+
+    # Profile (comprehensive)
+    'profile': 'generate_profile',
+    'user': 'generate_user',
+}
+
+_GENERATOR_KEYS = tuple(_FAKE_METHODS)
+
+# Types Faker can produce in bulk with a single call
+_BATCH_MAP = {
+    'word': lambda fake, n: fake.words(nb=n),
+    'sentence': lambda fake, n: fake.sentences(nb=n),
+    'paragraph': lambda fake, n: fake.paragraphs(nb=n),
+    'text': lambda fake, n: fake.texts(nb_texts=n),
+}
+
+
 class FakeDataGenerator:
     """Generate fake data of various types."""
 
@@ -15,8 +130,18 @@ class FakeDataGenerator:
         Args:
             locale: Locale for generated data (e.g., 'en_US', 'fr_FR')
         """
+        self.locale = locale
         self.fake = Faker(locale)
 
+        # Built once so generate() only has to do a single lookup. Types
+        # whose provider this locale lacks are left out.
+        self._generator_map = {}
+        for data_type, method in _FAKE_METHODS.items():
+            try:
+                self._generator_map[data_type] = attrgetter(method)(self)
+            except AttributeError:
+                pass
+
     def generate(self, data_type: str, count: int = 1) -> List[Any]:
         """
         Generate fake data based on the specified type.
@@ -28,89 +153,46 @@ class FakeDataGenerator:
         Returns:
             List of generated fake data items
         """
-        generator_map = {
-            # Personal
-            'name': self.fake.name,
-            'first_name': self.fake.first_name,
-            'last_name': self.fake.last_name,
-            'email': self.fake.email,
-            'phone': self.fake.phone_number,
-            'ssn': self.fake.ssn,
-            'username': self.fake.user_name,
-            'password': self.fake.password,
-
-            # Address
-            'address': self.fake.address,
-            'street_address': self.fake.street_address,
-            'city': self.fake.city,
-            'state': self.fake.state,
-            'zipcode': self.fake.zipcode,
-            'country': self.fake.country,
-            'latitude': self.fake.latitude,
-            'longitude': self.fake.longitude,
-
-            # Company
-            'company': self.fake.company,
-            'job': self.fake.job,
-            'company_email': self.fake.company_email,
-
-            # Internet
-            'url': self.fake.url,
-            'domain_name': self.fake.domain_name,
-            'ipv4': self.fake.ipv4,
-            'ipv6': self.fake.ipv6,
-            'mac_address': self.fake.mac_address,
-            'user_agent': self.fake.user_agent,
-
-            # Text
-            'text': self.fake.text,
-            'sentence': self.fake.sentence,
-            'paragraph': self.fake.paragraph,
-            'word': self.fake.word,
-
-            # Date/Time
-            'date': lambda: self.fake.date(),
-            'time': lambda: self.fake.time(),
-            'datetime': lambda: self.fake.date_time().isoformat(),
-            'year': self.fake.year,
-
-            # Numbers
-            'random_int': lambda: self.fake.random_int(min=0, max=1000),
-            'random_digit': self.fake.random_digit,
-
-            # Credit Card
-            'credit_card_number': self.fake.credit_card_number,
-            'credit_card_provider': self.fake.credit_card_provider,
-            'credit_card_expire': self.fake.credit_card_expire,
-
-            # Currency
-            'currency_code': self.fake.currency_code,
-            'currency_name': self.fake.currency_name,
-
-            # File
-            'file_name': self.fake.file_name,
-            'file_extension': self.fake.file_extension,
-            'mime_type': self.fake.mime_type,
-
-            # Color
-            'color_name': self.fake.color_name,
-            'hex_color': self.fake.hex_color,
-            'rgb_color': self.fake.rgb_color,
-
-            # UUID
-            'uuid4': lambda: str(self.fake.uuid4()),
-
-            # Profile (comprehensive)
-            'profile': self.generate_profile,
-            'user': self.generate_user,
-        }
-
-        generator = generator_map.get(data_type)
-        if not generator:
+        generator = self._generator_map.get(data_type)
+        if generator is None:
+            if data_type in _FAKE_METHODS:
+                raise ValueError(
+                    f"Data type {data_type} is not available for locale {self.locale}"
+                )
             raise ValueError(f"Unknown data type: {data_type}")
 
+        batch = _BATCH_MAP.get(data_type)
+        if batch is not None and count > 1:
+            return batch(self.fake, count)
+
         return [generator() for _ in range(count)]
 
+    def generate_bytes(self, data_type: str, count: int = 1) -> bytes:
+        """
+        Generate fake data and serialize it to JSON.
+
+        Args:
+            data_type: Type of fake data to generate
+            count: Number of items to generate
+
+        Returns:
+            JSON list of generated items, or the item itself if count is 1
+        """
+        data = self.generate(data_type, count)
+        return dumps(data if count > 1 else data[0])
+
+    def generate_datetime(self) -> str:
+        """Generate an ISO 8601 date and time."""
+        return self.fake.date_time().isoformat()
+
+    def generate_random_int(self) -> int:
+        """Generate an integer between 0 and 1000."""
+        return self.fake.random_int(min=0, max=1000)
+
+    def generate_uuid4(self) -> str:
+        """Generate a random UUID string."""
+        return str(self.fake.uuid4())
+
     def generate_profile(self) -> Dict[str, Any]:
         """Generate a complete user profile."""
         return {
@@ -135,17 +217,7 @@ class FakeDataGenerator:
             'created_at': self.fake.date_time().isoformat(),
         }
 
-    def get_available_types(self) -> List[str]:
-        """Get list of all available data types."""
-        return [
-            'name', 'first_name', 'last_name', 'email', 'phone', 'ssn',
-            'username', 'password', 'address', 'street_address', 'city',
-            'state', 'zipcode', 'country', 'latitude', 'longitude',
-            'company', 'job', 'company_email', 'url', 'domain_name',
-            'ipv4', 'ipv6', 'mac_address', 'user_agent', 'text',
-            'sentence', 'paragraph', 'word', 'date', 'time', 'datetime',
-            'year', 'random_int', 'random_digit', 'credit_card_number',
-            'credit_card_provider', 'credit_card_expire', 'currency_code',
-            'currency_name', 'file_name', 'file_extension', 'mime_type',
-            'color_name', 'hex_color', 'rgb_color', 'uuid4', 'profile', 'user'
-        ]
+    @staticmethod
+    def get_available_types() -> Tuple[str, ...]:
+        """Get all available data types."""
+        return _GENERATOR_KEYS
@@ -4,19 +4,315 @@ A simple API server for generating fake data that handles requests in separate t
 """
 
 import http.server
-import socketserver
 import logging
+import logging.handlers
+import os
+import queue
+import selectors
+import signal
+import socket
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+from faker import Faker
 
 from .api_handler import APIRequestHandler
 
+# Queued to the idle watcher to have it close its longest idle connection
+_EVICT = object()
+
+
+class ThreadedHTTPServer(http.server.HTTPServer):
+    """
+    HTTP Server that handles requests on a bounded pool of worker threads.
 
-class ThreadedHTTPServer(socketserver.ThreadingMixIn, http.server.HTTPServer):
-    """HTTP Server that handles each request in a separate thread."""
-    daemon_threads = True
+    Idle connections do not hold a worker: new connections and keep-alive
+    connections between requests wait in a selector on a watcher thread,
+    which submits each one to the pool once it becomes readable.
+    """
     allow_reuse_address = True
+    parks_idle_connections = True
+
+    # Seconds an idle connection is kept open
+    keep_alive_timeout = 15
+
+    # Connections per worker thread that may be open at once. Past this the
+    # server stops accepting, so a stalled pool cannot pile up sockets.
+    connections_per_thread = 16
+
+    def __init__(self, server_address, RequestHandlerClass, threads=None,
+                 bind_and_activate=True):
+        """
+        Initialize the server and its worker pool.
+
+        Args:
+            server_address: (host, port) tuple to bind to
+            RequestHandlerClass: Handler class instantiated for each request
+            threads: Number of worker threads (default: 4 per CPU)
+            bind_and_activate: Bind and listen immediately
+        """
+        if threads is None:
+            threads = (os.cpu_count() or 1) * 4
+        # Created first so server_close() can shut it down if binding fails
+        self._pool = ThreadPoolExecutor(
+            max_workers=threads,
+            thread_name_prefix='http-worker'
+        )
+        self._slots = threading.BoundedSemaphore(
+            threads * self.connections_per_thread
+        )
+        # Connections handed to the idle watcher, which runs while serving
+        self._parked = queue.SimpleQueue()
+        self._park_lock = threading.Lock()
+        self._waker = None
+        self._watcher = None
+        super().__init__(server_address, RequestHandlerClass, bind_and_activate)
+
+    def serve_forever(self, poll_interval=0.5):
+        """Serve requests while a thread watches idle connections."""
+        # Set up here rather than in __init__ so that forked workers each
+        # get their own selector and thread
+        wakeup, self._waker = socket.socketpair()
+        self._waker.setblocking(False)
+        self._watcher = threading.Thread(
+            target=self._watch_idle,
+            args=(wakeup,),
+            name='http-idle',
+            daemon=True
+        )
+        self._watcher.start()
+        try:
+            super().serve_forever(poll_interval)
+        finally:
+            self._stop_watcher()
+
+    def _stop_watcher(self):
+        """Stop the idle watcher, closing the connections it holds."""
+        with self._park_lock:
+            if self._waker is not None:
+                self._parked.put(None)
+                self._wake()
+                self._waker.close()
+                self._waker = None
+        if self._watcher is not None:
+            self._watcher.join()
+
+    def _wake(self):
+        """Interrupt the idle watcher's select() call."""
+        try:
+            self._waker.send(b'\0')
+        except BlockingIOError:
+            # Already has wakeups pending
+            pass
+
+    def _park(self, request, client_address):
+        """
+        Hand an idle connection to the watcher thread.
+
+        Returns:
+            False if the server is not serving and the connection must be
+            closed instead
+        """
+        with self._park_lock:
+            if self._waker is None:
+                return False
+            self._parked.put((request, client_address))
+            self._wake()
+        return True
+
+    def _watch_idle(self, wakeup):
+        """Resubmit idle connections once readable and close expired ones."""
+        # Idle connection -> (client address, expiry time), oldest first
+        idle = {}
+        with selectors.DefaultSelector() as selector, wakeup:
+            selector.register(wakeup, selectors.EVENT_READ)
+            while True:
+                timeout = None
+                if idle:
+                    _, expiry = next(iter(idle.values()))
+                    timeout = max(expiry - time.monotonic(), 0)
+                for key, _ in selector.select(timeout):
+                    request = key.fileobj
+                    if request is wakeup:
+                        wakeup.recv(4096)
+                        continue
+                    selector.unregister(request)
+                    client_address, _ = idle.pop(request)
+                    self._submit(request, client_address)
+
+                while True:
+                    try:
+                        item = self._parked.get_nowait()
+                    except queue.Empty:
+                        break
+                    if item is None:
+                        # The server stopped
+                        for request in idle:
+                            self.shutdown_request(request)
+                        return
+                    if item is _EVICT:
+                        if idle:
+                            request = next(iter(idle))
+                            selector.unregister(request)
+                            del idle[request]
+                            self.shutdown_request(request)
+                        continue
+                    request, client_address = item
+                    selector.register(request, selectors.EVENT_READ)
+                    idle[request] = (
+                        client_address,
+                        time.monotonic() + self.keep_alive_timeout
+                    )
+
+                now = time.monotonic()
+                while idle:
+                    request, (_, expiry) = next(iter(idle.items()))
+                    if expiry > now:
+                        break
+                    selector.unregister(request)
+                    del idle[request]
+                    self.shutdown_request(request)
+
+    def get_request(self):
+        """Accept a connection once there is room for it."""
+        if not self._slots.acquire(blocking=False):
+            # Make room by closing the connection that has been idle longest
+            with self._park_lock:
+                if self._waker is not None:
+                    self._parked.put(_EVICT)
+                    self._wake()
+            self._slots.acquire()
+        try:
+            return super().get_request()
+        except BaseException:
+            self._slots.release()
+            raise
+
+    def process_request(self, request, client_address):
+        """Wait for a new connection's first request off the worker pool."""
+        if not self._park(request, client_address):
+            self._submit(request, client_address)
+
+    def _submit(self, request, client_address):
+        """Hand a connection with data to read off to a pooled worker thread."""
+        future = self._pool.submit(self._handle, request, client_address)
+        future.add_done_callback(partial(self._discard, request))
+
+    def _discard(self, request, future):
+        """Close a connection whose queued handling was cancelled."""
+        if future.cancelled():
+            self.shutdown_request(request)
+
+    def finish_request(self, request, client_address):
+        """Serve a connection and return the handler that served it."""
+        return self.RequestHandlerClass(request, client_address, self)
+
+    def _handle(self, request, client_address):
+        """Serve a connection on a worker thread until it closes or goes idle."""
+        parked = False
+        try:
+            handler = self.finish_request(request, client_address)
+            parked = (getattr(handler, 'idle', False)
+                      and self._park(request, client_address))
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            if not parked:
+                self.shutdown_request(request)
+
+    def shutdown_request(self, request):
+        """Close a connection and free its slot."""
+        try:
+            super().shutdown_request(request)
+        finally:
+            self._slots.release()
+
+    def server_close(self):
+        """
+        Close the listening socket and stop the worker pool.
 
+        Connections still waiting for a worker are closed rather than served.
+        """
+        super().server_close()
+        self._stop_watcher()
+        self._pool.shutdown(wait=False, cancel_futures=True)
 
-def start_server(host='0.0.0.0', port=8000, verbose=False):
+
+def _fork_workers(count):
+    """
+    Fork worker processes that serve from the inherited listening socket.
+
+    Args:
+        count: Number of child processes to fork
+
+    Returns:
+        List of child PIDs in the parent, or None in a child
+    """
+    children = []
+    for _ in range(count):
+        pid = os.fork()
+        if pid == 0:
+            # Otherwise every worker replays the parent's random sequence
+            # and returns identical data
+            Faker.seed()
+            return None
+        children.append(pid)
+    return children
+
+
+def _stop_workers(children):
+    """Terminate forked worker processes and wait for them to exit."""
+    for pid in children:
+        try:
+            os.kill(pid, signal.SIGTERM)
+        except ProcessLookupError:
+            pass
+    for pid in children:
+        try:
+            os.waitpid(pid, 0)
+        except ChildProcessError:
+            pass
+
+
+def _configure_logging(verbose):
+    """
+    Route log records through a queue drained by a background thread.
+
+    Request threads then only enqueue records instead of contending for
+    the stream handler's lock and blocking on writes to stderr. Like
+    logging.basicConfig(), this does nothing if the root logger already has
+    handlers, so programs embedding the server keep their own setup.
+
+    Args:
+        verbose: Enable verbose logging
+
+    Returns:
+        The started QueueListener writing records to stderr, or None if
+        logging was already configured
+    """
+    root = logging.getLogger()
+    if root.handlers:
+        return None
+
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter(
+        '%(asctime)s - %(levelname)s - %(message)s',
+        datefmt='%Y-%m-%d %H:%M:%S'
+    ))
+    log_queue = queue.SimpleQueue()
+
+    root.setLevel(logging.DEBUG if verbose else logging.INFO)
+    root.handlers = [logging.handlers.QueueHandler(log_queue)]
+
+    listener = logging.handlers.QueueListener(log_queue, stream_handler)
+    listener.start()
+    return listener
+
+
+def start_server(host='0.0.0.0', port=8000, verbose=False, workers=None,
+                 threads=None):
     """
     Start the multithreaded fake data API server.
 
@@ -24,25 +320,57 @@ def start_server(host='0.0.0.0', port=8000, verbose=False):
         host: Host address to bind to
         port: Port number to listen on
         verbose: Enable verbose logging
+        workers: Number of worker processes (default: one per CPU)
+        threads: Number of worker threads per process (default: 4 per CPU)
     """
-    # Configure logging
-    log_level = logging.DEBUG if verbose else logging.INFO
-    logging.basicConfig(
-        level=log_level,
-        format='%(asctime)s - %(levelname)s - %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
-    )
+    log_listener = _configure_logging(verbose)
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers > 1 and not hasattr(os, 'fork'):
+        logging.warning("Multiple worker processes need os.fork(); using one")
+        workers = 1
 
     logging.info("Starting Fake Data API Server...")
     handler = APIRequestHandler
 
-    with ThreadedHTTPServer((host, port), handler) as httpd:
+    with ThreadedHTTPServer((host, port), handler, threads=threads) as httpd:
         addr, port = httpd.server_address
         logging.info(f"Server started at http://{addr}:{port}")
-        logging.info("Press Ctrl+C to stop the server")
+
+        children = []
+        if workers > 1:
+            # Every process polls the same socket, so the one that loses the
+            # race for a connection must get an error from accept() rather
+            # than block until the next one arrives
+            httpd.socket.setblocking(False)
+            # The listener thread does not survive fork(), so flush and
+            # stop it first and give every process its own
+            if log_listener is not None:
+                log_listener.stop()
+            children = _fork_workers(workers - 1)
+            if log_listener is not None:
+                log_listener.start()
+            if children is not None:
+                # Shut down gracefully on SIGTERM too, so workers are reaped
+                signal.signal(signal.SIGTERM, signal.default_int_handler)
+                logging.info(f"Serving with {workers} worker processes")
+
+        if children is not None:
+            logging.info("Press Ctrl+C to stop the server")
 
         try:
             httpd.serve_forever()
         except KeyboardInterrupt:
-            logging.info("\nShutting down server...")
+            if children is not None:
+                logging.info("\nShutting down server...")
             httpd.shutdown()
+        finally:
+            if children:
+                _stop_workers(children)
+            if log_listener is not None:
+                log_listener.stop()
+            if children is None:
+                # A worker must never return into the caller's code
+                httpd.server_close()
+                os._exit(0)
@@ -0,0 +1,96 @@
+"""
+Asynchronous Fake Data API Server
+An ASGI application served by uvicorn, using uvloop and httptools when available.
+"""
+
+import os
+
+import uvicorn
+
+from .api_handler import (
+    CACHE_HEADERS,
+    MAX_URI_LENGTH,
+    ROUTES,
+    error_response,
+    etag_matches,
+)
+
+
+async def app(scope, receive, send):
+    """ASGI application serving the fake data API."""
+    if scope['type'] != 'http':
+        return
+
+    # Routes are matched on the undecoded path, as in the threaded server
+    path = scope.get('raw_path') or scope['path'].encode('utf-8')
+    query_string = scope['query_string']
+    endpoint = ROUTES.get(path)
+    headers = [(b'access-control-allow-origin', b'*')]
+    if scope['method'] != 'GET':
+        status, content_type, body = error_response(
+            501, f"Unsupported method ({scope['method']!r})"
+        )
+    elif len(path) + len(query_string) > MAX_URI_LENGTH:
+        status, content_type, body = error_response(414, "URI too long")
+    elif endpoint is None:
+        status, content_type, body = error_response(
+            404, f"Endpoint not found: {path.decode('iso-8859-1')}"
+        )
+    else:
+        cache = CACHE_HEADERS.get(path)
+        if cache is not None:
+            etag, cache_control = cache
+            headers += [(b'etag', etag), (b'cache-control', cache_control)]
+            if_none_match = next(
+                (value for name, value in scope['headers']
+                 if name == b'if-none-match'),
+                b''
+            )
+            if if_none_match and etag_matches(if_none_match, etag):
+                await send({
+                    'type': 'http.response.start',
+                    'status': 304,
+                    'headers': headers,
+                })
+                await send({'type': 'http.response.body', 'body': b''})
+                return
+        status, content_type, body = endpoint(query_string)
+
+    headers += [
+        (b'content-type', content_type),
+        (b'content-length', str(len(body)).encode('ascii')),
+    ]
+    await send({
+        'type': 'http.response.start',
+        'status': status,
+        'headers': headers,
+    })
+    await send({'type': 'http.response.body', 'body': body})
+
+
+def start_async_server(host='0.0.0.0', port=8000, verbose=False, workers=None):
+    """
+    Start the fake data API server on uvicorn.
+
+    Args:
+        host: Host address to bind to
+        port: Port number to listen on
+        verbose: Enable verbose logging
+        workers: Number of worker processes (default: one per CPU)
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    uvicorn.run(
+        'http_server.server_async:app',
+        host=host,
+        port=port,
+        workers=workers,
+        # 'auto' picks uvloop and httptools when they are installed
+        loop='auto',
+        http='auto',
+        lifespan='off',
+        log_level='debug' if verbose else 'info',
+        # Per-request access logs only with --verbose, as in the threaded server
+        access_log=verbose,
+    )
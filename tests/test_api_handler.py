@@ -0,0 +1,232 @@
+"""Tests for the hand-written HTTP parser in APIRequestHandler."""
+
+import re
+import socket
+import threading
+import time
+import unittest
+
+from http_server.api_handler import APIRequestHandler, _parse_query
+
+
+def serve(data: bytes) -> bytes:
+    """
+    Run the handler over a loopback connection fed with raw request bytes.
+
+    Args:
+        data: Everything the client sends before closing its write side
+
+    Returns:
+        Everything the handler wrote back
+    """
+    with socket.create_server(('127.0.0.1', 0)) as listener:
+        client = socket.create_connection(listener.getsockname())
+        server, _ = listener.accept()
+    with client, server:
+        client.sendall(data)
+        client.shutdown(socket.SHUT_WR)
+        APIRequestHandler(server, ('127.0.0.1', 0), None)
+        server.close()
+        chunks = []
+        while chunk := client.recv(65536):
+            chunks.append(chunk)
+    return b''.join(chunks)
+
+
+def statuses(response: bytes) -> list:
+    """Return the status code of every response in a byte stream."""
+    # Responses are not newline separated, so status lines are not anchored
+    return [int(code) for code in re.findall(rb'HTTP/1\.1 (\d{3}) ', response)]
+
+
+def connection(response: bytes) -> bytes:
+    """Return the Connection header of the last response in a byte stream."""
+    return re.findall(rb'^Connection: (\S+)\r$', response, re.M)[-1]
+
+
+class RequestParsingTests(unittest.TestCase):
+    """Request line and header parsing."""
+
+    def test_get(self):
+        response = serve(b'GET /api/health HTTP/1.1\r\nHost: x\r\n\r\n')
+        self.assertEqual(statuses(response), [200])
+        self.assertIn(b'"healthy"', response)
+        self.assertEqual(connection(response), b'keep-alive')
+
+    def test_query(self):
+        response = serve(b'GET /api/generate?type=email&count=3 HTTP/1.1\r\n\r\n')
+        self.assertEqual(statuses(response), [200])
+        self.assertIn(b'"count":3', response)
+
+    def test_pipelined_requests(self):
+        response = serve(
+            b'GET /api/health HTTP/1.1\r\n\r\n'
+            b'GET /api/types HTTP/1.1\r\n\r\n'
+            b'GET /missing HTTP/1.1\r\n\r\n'
+        )
+        self.assertEqual(statuses(response), [200, 200, 404])
+
+    def test_leading_empty_lines_ignored(self):
+        response = serve(b'\r\nGET /api/health HTTP/1.1\r\n\r\n')
+        self.assertEqual(statuses(response), [200])
+
+    def test_absolute_form_target(self):
+        response = serve(
+            b'GET http://localhost:8000/api/health HTTP/1.1\r\n\r\n'
+            b'GET HTTP://localhost/api/generate?type=email HTTP/1.1\r\n\r\n'
+            b'GET http://localhost HTTP/1.1\r\n\r\n'
+        )
+        self.assertEqual(statuses(response), [200, 200, 200])
+        self.assertIn(b'"type":"email"', response)
+
+    def test_bare_lf_line_endings(self):
+        response = serve(
+            b'GET /api/health HTTP/1.1\nHost: x\n\n'
+            b'GET /api/types HTTP/1.0\n\n'
+        )
+        self.assertEqual(statuses(response), [200, 200])
+        self.assertEqual(connection(response), b'close')
+
+    def test_extra_whitespace_in_request_line(self):
+        response = serve(b'GET  /api/health\tHTTP/1.1\r\n\r\n')
+        self.assertEqual(statuses(response), [200])
+
+    def test_connection_option_list(self):
+        response = serve(
+            b'GET /api/health HTTP/1.1\r\nConnection: TE, close\r\n\r\n'
+            b'GET /api/health HTTP/1.1\r\n\r\n'
+        )
+        self.assertEqual(statuses(response), [200])
+        self.assertEqual(connection(response), b'close')
+
+        response = serve(
+            b'GET /api/health HTTP/1.0\r\nConnection: Keep-Alive, TE\r\n\r\n'
+            b'GET /api/health HTTP/1.0\r\n\r\n'
+        )
+        self.assertEqual(statuses(response), [200, 200])
+
+    def test_http_1_0_closes_by_default(self):
+        response = serve(
+            b'GET /api/health HTTP/1.0\r\n\r\n'
+            b'GET /api/health HTTP/1.0\r\n\r\n'
+        )
+        self.assertEqual(statuses(response), [200])
+        self.assertEqual(connection(response), b'close')
+
+    def test_http_1_0_keep_alive(self):
+        response = serve(
+            b'GET /api/health HTTP/1.0\r\nConnection: keep-alive\r\n\r\n'
+            b'GET /api/health HTTP/1.0\r\n\r\n'
+        )
+        self.assertEqual(statuses(response), [200, 200])
+
+    def test_connection_close(self):
+        response = serve(
+            b'GET /api/health HTTP/1.1\r\nConnection: close\r\n\r\n'
+            b'GET /api/health HTTP/1.1\r\n\r\n'
+        )
+        self.assertEqual(statuses(response), [200])
+        self.assertEqual(connection(response), b'close')
+
+    def test_request_body_closes_connection(self):
+        response = serve(
+            b'GET /api/health HTTP/1.1\r\nContent-Length: 5\r\n\r\nhello'
+            b'GET /api/health HTTP/1.1\r\n\r\n'
+        )
+        self.assertEqual(statuses(response), [200])
+        self.assertEqual(connection(response), b'close')
+
+    def test_etag_not_modified(self):
+        etag = re.search(
+            rb'^ETag: (\S+)\r$', serve(b'GET /api/types HTTP/1.1\r\n\r\n'), re.M
+        ).group(1)
+        response = serve(
+            b'GET /api/types HTTP/1.1\r\nIf-None-Match: W/%s\r\n\r\n' % etag
+        )
+        self.assertEqual(statuses(response), [304])
+        self.assertNotIn(b'"types"', response)
+
+
+class RequestErrorTests(unittest.TestCase):
+    """Requests rejected by the parser."""
+
+    def test_bad_request_line(self):
+        response = serve(b'GET /api/health\r\n\r\n')
+        self.assertEqual(statuses(response), [400])
+        self.assertEqual(connection(response), b'close')
+
+    def test_unsupported_version(self):
+        response = serve(b'GET /api/health HTTP/2.0\r\n\r\n')
+        self.assertEqual(statuses(response), [505])
+
+    def test_unsupported_method(self):
+        response = serve(
+            b'POST /api/health HTTP/1.1\r\n\r\n'
+            b'GET /api/health HTTP/1.1\r\n\r\n'
+        )
+        self.assertEqual(statuses(response), [501])
+        self.assertEqual(connection(response), b'close')
+
+    def test_uri_too_long(self):
+        response = serve(b'GET /api/generate?type=%s HTTP/1.1\r\n\r\n' % (b'x' * 600))
+        self.assertEqual(statuses(response), [414])
+
+    def test_head_too_large(self):
+        # Exactly the limit without a terminating blank line, so nothing is
+        # left unread to make the close reset the connection
+        head = b'GET /api/health HTTP/1.1\r\nX-Padding: '
+        response = serve(head.ljust(8192, b'x'))
+        self.assertEqual(statuses(response), [431])
+        self.assertEqual(connection(response), b'close')
+
+
+class SlowClientTests(unittest.TestCase):
+    """Clients that never finish sending a request head."""
+
+    def test_trickled_head_times_out(self):
+        class Handler(APIRequestHandler):
+            timeout = 0.5
+
+        with socket.create_server(('127.0.0.1', 0)) as listener:
+            client = socket.create_connection(listener.getsockname())
+            server, _ = listener.accept()
+        with client, server:
+            thread = threading.Thread(
+                target=Handler, args=(server, ('127.0.0.1', 0), None)
+            )
+            start = time.monotonic()
+            thread.start()
+            # Each byte arrives well within the timeout, the head never does
+            for byte in b'GET /api/health HTTP/1.1\r\n':
+                client.send(bytes([byte]))
+                thread.join(0.1)
+                if not thread.is_alive():
+                    break
+            thread.join(5)
+            self.assertLess(time.monotonic() - start, 1.5)
+
+
+class ParseQueryTests(unittest.TestCase):
+    """Query string parsing."""
+
+    def test_plain(self):
+        self.assertEqual(
+            _parse_query(b'type=email&count=5'),
+            {b'type': 'email', b'count': '5'}
+        )
+
+    def test_escaped_values_and_keys(self):
+        self.assertEqual(
+            _parse_query(b'typ%65=first+name&locale=fr%5FFR'),
+            {b'type': 'first name', b'locale': 'fr_FR'}
+        )
+
+    def test_first_occurrence_wins(self):
+        self.assertEqual(_parse_query(b'type=email&typ%65=name'), {b'type': 'email'})
+
+    def test_blank_values_ignored(self):
+        self.assertEqual(_parse_query(b'type=&count&=5'), {b'': '5'})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,107 @@
+"""Tests for FakeDataGenerator and the per-locale generator cache."""
+
+import json
+import unittest
+from unittest import mock
+
+from http_server.api_handler import _get_generator, generate_response
+from http_server.fake_data import _FAKE_METHODS, FakeDataGenerator
+
+
+class AvailableTypesTests(unittest.TestCase):
+    """Data types advertised by the generator."""
+
+    def test_available_types_match_generator_map(self):
+        generator = FakeDataGenerator()
+        self.assertEqual(
+            list(FakeDataGenerator.get_available_types()),
+            list(generator._generator_map)
+        )
+
+    def test_every_type_generates(self):
+        generator = FakeDataGenerator()
+        for data_type in FakeDataGenerator.get_available_types():
+            with self.subTest(data_type=data_type):
+                self.assertEqual(len(generator.generate(data_type, 2)), 2)
+
+    def test_unknown_type(self):
+        with self.assertRaisesRegex(ValueError, "Unknown data type: nope"):
+            FakeDataGenerator().generate('nope')
+
+
+class LocaleTests(unittest.TestCase):
+    """Types a locale lacks are left out rather than failing."""
+
+    def test_missing_types_are_skipped(self):
+        for locale, data_type in (('fr_FR', 'state'), ('de_DE', 'zipcode')):
+            with self.subTest(locale=locale):
+                generator = FakeDataGenerator(locale)
+                self.assertIn(data_type, _FAKE_METHODS)
+                self.assertNotIn(data_type, generator._generator_map)
+                with self.assertRaisesRegex(
+                    ValueError,
+                    f"Data type {data_type} is not available for locale {locale}"
+                ):
+                    generator.generate(data_type)
+                # The rest of the locale still works
+                self.assertEqual(len(generator.generate('city', 3)), 3)
+
+    def test_missing_type_is_a_client_error(self):
+        status, _, body = generate_response(b'type=state&locale=fr_FR')
+        self.assertEqual(status, 400)
+        self.assertEqual(json.loads(body), {
+            'success': False,
+            'error': 'Data type state is not available for locale fr_FR',
+        })
+
+    def test_hyphenated_locale_shares_generator(self):
+        self.assertIs(_get_generator('fr-FR'), _get_generator('fr_FR'))
+        self.assertEqual(generate_response(b'type=city&locale=en-US')[0], 200)
+
+    def test_unknown_locale(self):
+        with self.assertRaisesRegex(ValueError, "Unknown locale: xx_YY"):
+            _get_generator('xx-YY')
+        status, _, body = generate_response(b'locale=xx_YY')
+        self.assertEqual(status, 400)
+        self.assertEqual(json.loads(body)['error'], 'Unknown locale: xx_YY')
+
+
+class GenerateTests(unittest.TestCase):
+    """Generation and serialization paths."""
+
+    def setUp(self):
+        self.generator = FakeDataGenerator()
+
+    def test_batch_types_use_a_single_faker_call(self):
+        fake = self.generator.fake
+        with mock.patch.object(fake, 'words', wraps=fake.words) as words:
+            result = self.generator.generate('word', 5)
+        words.assert_called_once_with(nb=5)
+        self.assertEqual(len(result), 5)
+        self.assertTrue(all(isinstance(word, str) for word in result))
+
+    def test_batch_types(self):
+        for data_type in ('word', 'sentence', 'paragraph', 'text'):
+            with self.subTest(data_type=data_type):
+                result = self.generator.generate(data_type, 4)
+                self.assertEqual(len(result), 4)
+                self.assertTrue(all(isinstance(item, str) for item in result))
+
+    def test_single_item_skips_batch(self):
+        fake = self.generator.fake
+        with mock.patch.object(fake, 'words', wraps=fake.words) as words:
+            self.assertEqual(len(self.generator.generate('word', 1)), 1)
+        words.assert_not_called()
+
+    def test_generate_bytes_unwraps_single_item(self):
+        self.assertIsInstance(json.loads(self.generator.generate_bytes('uuid4')), str)
+        self.assertIsInstance(json.loads(self.generator.generate_bytes('profile', 1)), dict)
+
+    def test_generate_bytes_lists_multiple_items(self):
+        data = json.loads(self.generator.generate_bytes('uuid4', 3))
+        self.assertIsInstance(data, list)
+        self.assertEqual(len(data), 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,68 @@
+"""Tests for connection handling in ThreadedHTTPServer."""
+
+import socket
+import threading
+import time
+import unittest
+
+from http_server.api_handler import APIRequestHandler
+from http_server.server import ThreadedHTTPServer
+
+
+def get(connection: socket.socket) -> bytes:
+    """Send a health check over a connection and return the status line."""
+    connection.sendall(b'GET /api/health HTTP/1.1\r\n\r\n')
+    return connection.recv(4096).partition(b'\r\n')[0]
+
+
+class IdleConnectionTests(unittest.TestCase):
+    """Idle connections must not hold the worker pool."""
+
+    def setUp(self):
+        self.server = ThreadedHTTPServer(
+            ('127.0.0.1', 0), APIRequestHandler, threads=1
+        )
+        self.server.keep_alive_timeout = 0.5
+        thread = threading.Thread(target=self.server.serve_forever)
+        thread.start()
+        self.addCleanup(thread.join)
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+
+    def connect(self) -> socket.socket:
+        connection = socket.create_connection(self.server.server_address)
+        connection.settimeout(5)
+        self.addCleanup(connection.close)
+        return connection
+
+    def test_idle_connections_do_not_block_new_clients(self):
+        silent = self.connect()
+        kept_alive = self.connect()
+        self.assertEqual(get(kept_alive), b'HTTP/1.1 200 OK')
+
+        start = time.monotonic()
+        self.assertEqual(get(self.connect()), b'HTTP/1.1 200 OK')
+        self.assertLess(time.monotonic() - start, 1)
+
+        # Both idle connections are still served once they send a request
+        self.assertEqual(get(kept_alive), b'HTTP/1.1 200 OK')
+        self.assertEqual(get(silent), b'HTTP/1.1 200 OK')
+
+    def test_idle_connections_expire(self):
+        connection = self.connect()
+        self.assertEqual(get(connection), b'HTTP/1.1 200 OK')
+        self.assertEqual(connection.recv(4096), b'')
+
+    def test_full_server_evicts_longest_idle_connection(self):
+        self.server._slots = threading.BoundedSemaphore(2)
+        first, second = self.connect(), self.connect()
+        self.assertEqual(get(first), b'HTTP/1.1 200 OK')
+        self.assertEqual(get(second), b'HTTP/1.1 200 OK')
+
+        self.assertEqual(get(self.connect()), b'HTTP/1.1 200 OK')
+        self.assertEqual(first.recv(4096), b'')
+        self.assertEqual(get(second), b'HTTP/1.1 200 OK')
+
+
+if __name__ == '__main__':
+    unittest.main()